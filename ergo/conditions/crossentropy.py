@@ -1,4 +1,3 @@
-from jax import vmap
 import jax.numpy as np
 
 from ergo.distributions import point_density
@@ -57,7 +56,7 @@ class PartialCrossEntropyCondition(condition.Condition):
         super().__init__(weight)
 
     def loss(self, q_dist) -> float:
-        q_logps = vmap(q_dist.logpdf)(self.xs)
+        q_logps = q_dist.logpdf(self.xs)
         cross_entropy = -np.dot(self.ps, q_logps)
         return self.weight * cross_entropy
 
@@ -72,13 +71,9 @@ class PartialCrossEntropyCondition(condition.Condition):
         return "Minimize the cross-entropy of the two distributions (p may be partial)"
 
     def normalize(self, scale: Scale):
-        # TODO: Vectorization should be part of what Scale does
-        # scale.normalize_point / scale.denormalize_point is pretty much
-        # vectorized anyway
-        normed_xs = vmap(scale.normalize_point)(self.xs)
+        normed_xs = scale.normalize_points(self.xs)
         return PartialCrossEntropyCondition(normed_xs, self.ps, self.weight)
 
     def denormalize(self, scale: Scale):
-        # TODO: Vectorization should be part of what Scale does
-        denormed_xs = vmap(scale.denormalize_point)(self.xs)
+        denormed_xs = scale.denormalize_points(self.xs)
         return PartialCrossEntropyCondition(denormed_xs, self.ps, self.weight)
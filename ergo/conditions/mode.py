@@ -19,21 +19,20 @@ class ModeCondition(condition.Condition):
 
     def loss(self, dist) -> float:
         p_outcome = dist.pdf(self.outcome)
-        p_highest = np.max(
-            dist.scale.denormalize_densities(
-                dist.scale.denormalize_points(dist.normed_xs), dist.normed_densities
-            )
-        )
+        p_highest = self.highest_density(dist)
         return self.weight * (p_highest - p_outcome) ** 2
 
+    def highest_density(self, dist):
+        # dist.true_xs caches the denormalized points, so don't redo
+        # the denormalization here
+        return np.max(
+            dist.scale.denormalize_densities(dist.true_xs, dist.normed_densities)
+        )
+
     def _describe_fit(self, dist):
         description = super()._describe_fit(dist)
         description["p_outcome"] = dist.pdf(self.outcome)
-        description["p_highest"] = np.max(
-            dist.scale.denormalize_densities(
-                dist.scale.denormalize_points(dist.normed_xs), dist.normed_densities
-            )
-        )
+        description["p_highest"] = self.highest_density(dist)
         return description
 
     def normalize(self, scale: Scale):
@@ -1,4 +1,3 @@
-from jax import vmap
 import jax.numpy as np
 
 from ergo.scale import Scale
@@ -22,9 +21,7 @@ class PointDensityCondition(condition.Condition):
         super().__init__(weight)
 
     def loss(self, dist):
-        entry_loss_fn = lambda x, density: (density - dist.pdf(x)) ** 2  # noqa: E731
-        total_loss = np.sum(vmap(entry_loss_fn)(self.xs, self.densities))
-        return self.weight * total_loss / self.xs.size
+        return self.weight * np.mean(np.square(self.densities - dist.pdf(self.xs)))
 
     def normalize(self, scale: Scale):
         normed_xs = scale.normalize_points(self.xs)
@@ -48,10 +45,7 @@ class PointDensityCondition(condition.Condition):
     def _describe_fit(self, dist):
         description = super()._describe_fit(dist)
 
-        def entry_distance_fn(x, density):
-            return abs(1.0 - density / dist.pdf(x))
-
-        distances = vmap(entry_distance_fn)(self.xs, self.densities)
+        distances = np.abs(1.0 - self.densities / dist.pdf(self.xs))
         description["max_distance"] = np.max(distances)
         description["90th_distance"] = np.percentile(distances, 90)
         description["mean_distance"] = np.mean(distances)
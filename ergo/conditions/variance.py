@@ -30,7 +30,7 @@ class VarianceCondition(condition.Condition):
         return self.__class__(normalized_variance, self.weight)
 
     def denormalize(self, scale: Scale):
-        denormalized_variance = scale.denormalize_point(self.variance)
+        denormalized_variance = scale.denormalize_variance(self.variance)
         return self.__class__(denormalized_variance, self.weight)
 
     def destructure(self):
@@ -65,7 +65,19 @@ def get_daily_hospital_confirmed(
             ]
         )
 
-    recent_cases = [[get_recent_cases_data(date)] for date in data_dates]
+    # The windows for consecutive dates overlap almost entirely, so for
+    # the regression inputs get each day's infections once and take
+    # rolling window sums, instead of re-asking for every day in every
+    # window (hospital_stay_days calls per date)
+    first_needed = min(data_dates) - timedelta(hospital_stay_days - 1)
+    span_days = (max(data_dates) - first_needed).days + 1
+    span_dates = [first_needed + timedelta(n) for n in range(span_days)]
+    daily_cases = pd.Series(
+        [daily_infections_fn(date) for date in span_dates], index=span_dates
+    )
+    window_sums = daily_cases.rolling(hospital_stay_days).sum()
+
+    recent_cases = [[window_sums[date]] for date in data_dates]
 
     reg = sklearn.linear_model.LinearRegression(fit_intercept=False).fit(
         recent_cases, hospital_confirmed
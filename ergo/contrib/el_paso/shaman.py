@@ -125,5 +125,27 @@ def cu_projections_for_dates(
     """
     Get Columbia model projections over a range of dates
     """
-    date_range = daterange(start_date, end_date)
-    return [cu_projection(param, date, cu_projections) for date in date_range]
+    scenario = cu_model_scenario(tuple([s for s in cu_projections.keys()]))
+    quantile = float(cu_model_quantile())
+
+    xs = np.array([0.025, 0.25, 0.5, 0.75, 0.975])
+    scenario_df = cu_projections[scenario]
+    param_df = scenario_df[scenario_df["var"] == param]
+
+    dates = list(daterange(start_date, end_date))
+    date_df = param_df[param_df["Date"].isin(dates)]
+    missing = set(dates) - set(date_df["Date"])
+    if missing:
+        raise KeyError(
+            f"No Columbia projection for param: {param}, dates: {sorted(missing)}"
+        )
+
+    # One date-ordered (num_dates, 5) matrix of quantile values; the
+    # interpolation weights only depend on the sampled quantile, so
+    # interpolate all dates with one vectorized expression instead of
+    # re-filtering the dataframe per date
+    ys = date_df.sort_values("Date")[["2.5", "25", "50", "75", "97.5"]].to_numpy()
+    j = np.clip(np.searchsorted(xs, quantile), 1, xs.size - 1)
+    frac = np.clip((quantile - xs[j - 1]) / (xs[j] - xs[j - 1]), 0.0, 1.0)
+    projections = ys[:, j - 1] + frac * (ys[:, j] - ys[:, j - 1])
+    return [int(round(projection)) for projection in projections]
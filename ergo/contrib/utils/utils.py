@@ -1,6 +1,12 @@
 from datetime import timedelta
 
+ONE_DAY = timedelta(days=1)
+
 
 def daterange(start_date, end_date):
-    for n in range(int((end_date - start_date).days)):
-        yield start_date + timedelta(n)
+    # Step by a shared one-day delta instead of constructing a fresh
+    # timedelta(n) for every offset
+    current_date = start_date
+    while current_date < end_date:
+        yield current_date
+        current_date += ONE_DAY
@@ -18,7 +18,13 @@ from .base import (
     random_integer,
     uniform,
 )
-from .constants import bin_sizes, grid, point_density_default_num_points, target_xs
+from .constants import (
+    bin_sizes,
+    grid,
+    log_bin_sizes,
+    point_density_default_num_points,
+    target_xs,
+)
 from .distribution import Distribution
 from .logistic import Logistic
 from .logistic_mixture import LogisticMixture
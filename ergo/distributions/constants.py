@@ -7,3 +7,4 @@ bin_sizes = np.full(
 )
 grid = np.linspace(0, 1, point_density_default_num_points + 1)
 target_xs = (grid[1:] + grid[:-1]) / 2
+log_bin_sizes = np.log(bin_sizes)
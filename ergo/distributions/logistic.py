@@ -31,7 +31,7 @@ class Logistic(Distribution):
         # TODO (#303): Raise ValueError on scale < 0
         if normalized:
             self.loc = loc
-            self.s = np.max([s, 0.0000001])
+            self.s = np.maximum(s, 0.0000001)
             self.metadata = metadata
             if scale is not None:
                 self.scale = scale
@@ -44,7 +44,7 @@ class Logistic(Distribution):
             raise ValueError("Either a Scale or normalized parameters are required")
         else:
             self.loc = scale.normalize_point(loc)
-            self.s = np.max([s, 0.0000001]) / scale.width
+            self.s = np.maximum(s, 0.0000001) / scale.width
             self.scale = scale
             self.metadata = metadata
             self.true_s = s  # convenience field only used in repr currently
@@ -61,7 +61,11 @@ class Logistic(Distribution):
 
     def pdf(self, x):
         y = (self.scale.normalize_point(x) - self.loc) / self.s
-        p = np.exp(scipy.stats.logistic.logpdf(y) - np.log(self.s))
+        # logistic pdf is sigma(y) * (1 - sigma(y)) / s; it is even in
+        # y, so evaluate at -|y| where 1 - sigma never cancels to 0 in
+        # float32 (at y it does for y > ~16)
+        e = scipy.special.expit(-np.abs(y))
+        p = e * (1 - e) / self.s
         return self.scale.denormalize_density(x, p)
 
     def logpdf(self, x):
@@ -69,12 +73,10 @@ class Logistic(Distribution):
 
     def cdf(self, x):
         y = (self.scale.normalize_point(x) - self.loc) / self.s
-        return scipy.stats.logistic.cdf(y)
+        return scipy.special.expit(y)
 
     def ppf(self, q):
-        return self.scale.denormalize_point(
-            oscipy.stats.logistic(loc=self.loc, scale=self.s).ppf(q)
-        )
+        return self.scale.denormalize_point(self.loc + self.s * oscipy.special.logit(q))
 
     def sample(self):
         return self.scale.denormalize_point(
@@ -1,10 +1,9 @@
 from dataclasses import dataclass
 from typing import Sequence
 
-from jax import nn, scipy
+from jax import jit, nn, scipy
 import jax.numpy as np
 import numpy as onp
-import scipy as oscipy
 
 from ergo.scale import Scale
 
@@ -15,6 +14,35 @@ from .optimizable import Optimizable
 from .truncate import Truncate
 
 
+@jit
+def squash_params(opt_params, floor, ceiling, low, high, width):
+    """
+    Map unconstrained optimizer params to in-range (locs, scales,
+    probs) component params. Jitted once at module level so the eager
+    from_params calls made after each fit try run as a single compiled
+    kernel instead of dispatching each op separately.
+    """
+    # Allow logistic center to exceed the range by 20%
+    loc_min = np.maximum(low, floor) - 0.2 * width
+    loc_max = np.minimum(high, ceiling) + 0.2 * width
+    loc_range = loc_max - loc_min
+    structured_params = opt_params.reshape((-1, 3))
+    locs = loc_min + scipy.special.expit(structured_params[:, 0]) * loc_range
+    # Allow logistic scales between 0.01 and 0.5
+    # Don't allow tiny scales outside of the visible range
+    s_min = 0.01 + 0.1 * np.where(
+        (locs < low), low - locs, np.where(locs > high, locs - high, 0.0),
+    )
+    s_max = 0.5
+    s_range = s_max - s_min
+    ss = s_min + scipy.special.expit(structured_params[:, 1]) * s_range
+    # Allow probs > 0.01
+    probs = 0.01 + nn.softmax(structured_params[:, 2]) * (
+        1 - 0.01 * structured_params[:, 2].size
+    )
+    return locs, ss, probs
+
+
 @dataclass
 class LogisticMixture(Distribution, Optimizable):
     """
@@ -30,16 +58,24 @@ class LogisticMixture(Distribution, Optimizable):
     # Distribution
 
     def pdf(self, x):
-        return np.sum([c.pdf(x) * p for (c, p) in zip(self.components, self.probs)])
+        # axis=0 sums over components only, so x may be a vector of queries
+        return np.sum(
+            np.array([c.pdf(x) * p for (c, p) in zip(self.components, self.probs)]),
+            axis=0,
+        )
 
     def logpdf(self, x):
-        scores = []
-        for (c, p) in zip(self.components, self.probs):
-            scores.append(c.logpdf(x) + np.log(p))
-        return scipy.special.logsumexp(np.array(scores))
+        # logsumexp over the component axis only, so x may be a vector
+        scores = np.array(
+            [c.logpdf(x) + np.log(p) for (c, p) in zip(self.components, self.probs)]
+        )
+        return scipy.special.logsumexp(scores, axis=0)
 
     def cdf(self, x):
-        return np.sum([c.cdf(x) * p for (c, p) in zip(self.components, self.probs)])
+        return np.sum(
+            np.array([c.cdf(x) * p for (c, p) in zip(self.components, self.probs)]),
+            axis=0,
+        )
 
     def ppf(self, q):
         """
@@ -53,19 +89,27 @@ class LogisticMixture(Distribution, Optimizable):
         The quantile of a mixture distribution can always be found
         within the range of its components quantiles:
         https://cran.r-project.org/web/packages/mistr/vignettes/mistr-introduction.pdf
+
+        The mixture cdf is monotone, so we bisect that bracket with
+        array ops (which also lets q be a vector of quantiles) rather
+        than handing a Python callback to scipy's scalar root finder.
         """
         if len(self.components) == 1:
             return self.components[0].ppf(q)
-        ppfs = [c.ppf(q) for c in self.components]
-        cmin = np.min(ppfs)
-        cmax = np.max(ppfs)
-
-        return oscipy.optimize.bisect(
-            lambda x: self.cdf(x) - q,
-            cmin - abs(cmin / 100),
-            cmax + abs(cmax / 100),
-            maxiter=1000,
-        )
+        ppfs = np.array([c.ppf(q) for c in self.components])
+        cmin = np.min(ppfs, axis=0)
+        cmax = np.max(ppfs, axis=0)
+        lo = cmin - np.abs(cmin / 100)
+        hi = cmax + np.abs(cmax / 100)
+
+        # Each iteration halves the bracket; 50 takes any question
+        # range down to float precision
+        for _ in range(50):
+            mid = (lo + hi) / 2
+            below = self.cdf(mid) < q
+            lo = np.where(below, mid, lo)
+            hi = np.where(below, hi, mid)
+        return (lo + hi) / 2
 
     def sample(self):
         i = categorical(np.array(self.probs))
@@ -122,35 +166,17 @@ class LogisticMixture(Distribution, Optimizable):
             scale = Scale(0.0, 1.0)
         floor = fixed_params.get("floor", -np.inf)
         ceiling = fixed_params.get("ceiling", np.inf)
-        # Allow logistic center to exceed the range by 20%
-        loc_min = np.maximum(scale.low, floor) - 0.2 * scale.width
-        loc_max = np.minimum(scale.high, ceiling) + 0.2 * scale.width
-        loc_range = loc_max - loc_min
-        structured_params = opt_params.reshape((-1, 3))
-        locs = loc_min + scipy.special.expit(structured_params[:, 0]) * loc_range
-        # Allow logistic scales between 0.01 and 0.5
-        # Don't allow tiny scales outside of the visible range
-        s_min = 0.01 + 0.1 * np.where(
-            (locs < scale.low),
-            scale.low - locs,
-            np.where(locs > scale.high, locs - scale.high, 0.0),
-        )
-        s_max = 0.5
-        s_range = s_max - s_min
-        ss = s_min + scipy.special.expit(structured_params[:, 1]) * s_range
-        # Allow probs > 0.01
-        probs = list(
-            0.01
-            + nn.softmax(structured_params[:, 2])
-            * (1 - 0.01 * structured_params[:, 2].size)
+        locs, ss, probs = squash_params(
+            opt_params, floor, ceiling, scale.low, scale.high, scale.width
         )
         # Bundle up components
-        component_logistics = [
-            Logistic(l, s, scale, normalized=True) for (l, s) in zip(locs, ss)
-        ]
         components = [
-            Truncate(base_dist=cl, floor=floor, ceiling=ceiling)
-            for cl in component_logistics
+            Truncate(
+                base_dist=Logistic(l, s, scale, normalized=True),
+                floor=floor,
+                ceiling=ceiling,
+            )
+            for (l, s) in zip(locs, ss)
         ]
         mixture = cls(components=components, probs=probs)
         return mixture
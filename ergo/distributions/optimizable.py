@@ -53,13 +53,24 @@ class Optimizable(ABC):
         fixed_params = cls.normalize_fixed_params(fixed_params, scale)
         normalized_data = np.array(scale.normalize_points(data))
 
+        # As in from_conditions, the optimizer evaluates loss and jac at
+        # the same point; share one value_and_grad pass between them
+        cache: dict = {"key": None, "value": None}
+
+        def loss_and_grad(opt_params):
+            key = onp.asarray(opt_params).tobytes()
+            if cache["key"] != key:
+                cache["key"] = key
+                cache["value"] = static.dist_logloss_and_grad(
+                    cls, fixed_params, opt_params, normalized_data
+                )
+            return cache["value"]
+
         def loss(opt_params):
-            return static.dist_logloss(cls, fixed_params, opt_params, normalized_data)
+            return loss_and_grad(opt_params)[0]
 
         def jac(opt_params):
-            return static.dist_grad_logloss(
-                cls, fixed_params, opt_params, normalized_data
-            )
+            return loss_and_grad(opt_params)[1]
 
         normalized_dist = cls.from_loss(
             loss,
@@ -99,17 +110,37 @@ class Optimizable(ABC):
             cond_classes, cond_params = [], []
 
         if jit_all:
-            jitted_loss = static.jitted_condition_loss
-            jitted_jac = static.jitted_condition_loss_grad
-        else:
-            jitted_loss = static.condition_loss
-            jitted_jac = static.condition_loss_grad
 
-        def loss(opt_params):
-            return jitted_loss(cls, fixed_params, opt_params, cond_classes, cond_params)
+            def loss(opt_params):
+                return static.jitted_condition_loss(
+                    cls, fixed_params, opt_params, cond_classes, cond_params
+                )
 
-        def jac(opt_params):
-            return jitted_jac(cls, fixed_params, opt_params, cond_classes, cond_params)
+            def jac(opt_params):
+                return static.jitted_condition_loss_grad(
+                    cls, fixed_params, opt_params, cond_classes, cond_params
+                )
+
+        else:
+            # The optimizer calls loss and jac separately at the same
+            # point; compute both in one value_and_grad pass and reuse
+            # the result for whichever is asked for second
+            cache: dict = {"key": None, "value": None}
+
+            def loss_and_grad(opt_params):
+                key = onp.asarray(opt_params).tobytes()
+                if cache["key"] != key:
+                    cache["key"] = key
+                    cache["value"] = static.condition_loss_and_grad(
+                        cls, fixed_params, opt_params, cond_classes, cond_params
+                    )
+                return cache["value"]
+
+            def loss(opt_params):
+                return loss_and_grad(opt_params)[0]
+
+            def jac(opt_params):
+                return loss_and_grad(opt_params)[1]
 
         normalized_dist = cls.from_loss(
             fixed_params=fixed_params,
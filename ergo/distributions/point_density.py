@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 
 from backports.cached_property import cached_property
-from jax import nn
+from jax import nn, tree_util
 import jax.numpy as np
 import numpy as onp
 from scipy.interpolate import interp1d
@@ -30,8 +30,9 @@ class PointDensity(Distribution, Optimizable):
         densities,
         scale: Scale,
         normalized=False,
-        traceable=False,
         cumulative_normed_ps=None,
+        true_xs=None,
+        bin_probs=None,
     ):
         if scale is None:
             raise ValueError
@@ -46,24 +47,24 @@ class PointDensity(Distribution, Optimizable):
             self.normed_xs = scale.normalize_points(xs)
             self.normed_densities = scale.normalize_densities(self.normed_xs, densities)
 
+        self.bin_probs = bin_probs
+        if bin_probs is None:
+            self.bin_probs = self.normed_densities * constants.bin_sizes
+
         self.cumulative_normed_ps = cumulative_normed_ps
         if cumulative_normed_ps is None:
             self.cumulative_normed_ps = np.append(
                 np.array([0]), np.cumsum(self.bin_probs)
             )
 
-    @cached_property
-    def bin_probs(self):
-        return self.normed_densities * constants.bin_sizes
+        self.true_xs = true_xs
+        if true_xs is None:
+            self.true_xs = scale.denormalize_points(self.normed_xs)
 
     @cached_property
     def normed_log_densities(self):
         return safe_log(self.normed_densities)
 
-    @cached_property
-    def true_xs(self):
-        return self.scale.denormalize_points(self.normed_xs)
-
     @cached_property
     def true_grid(self):
         return self.scale.denormalize_points(constants.grid)
@@ -73,20 +74,18 @@ class PointDensity(Distribution, Optimizable):
     def pdf(self, x):
         """
         If x is out of distribution range, returns 0. Otherwise,
-        returns the true ("denormalized") density at the point in
-        self.normed_xs which is closest to normalized x by absolute
-        difference.
+        returns the true ("denormalized") density of the bin whose
+        edges contain normalized x.
 
         :param x: The point at which to get the probability density
         """
         x = self.scale.normalize_point(x)
-        bin = np.argmin(np.abs(self.normed_xs - x))
+        bin = self._containing_bin(x)
         return np.where(
             (x < 0) | (x > 1),
             0,
             self.scale.denormalize_density(
-                self.scale.denormalize_point(self.normed_xs[bin]),
-                self.normed_densities[bin],
+                self.true_xs[bin], self.normed_densities[bin]
             ),
         )
 
@@ -95,20 +94,45 @@ class PointDensity(Distribution, Optimizable):
 
     def cdf(self, x):
         """
-        If x is below the distribution range, returns 0. If x is
-        above the distribution range, returns 1.
-        Otherwise, it returns the closest bin edge and returns the cdf to that point
+        If x is below the distribution range, returns 0. If x is at or
+        above the top of the range, returns 1. Otherwise, returns the
+        cumulative density up to the lower edge of the bin containing x
 
         :param x: The point at which to get the cumulative density
         """
 
         x = self.scale.normalize_point(x)
-        bin = np.argmin(np.abs(constants.grid - x))
-        return np.where(x < 0, 0, np.where(x > 1, 1, self.cumulative_normed_ps[bin]))
+        bin = self._containing_bin(x)
+        return np.where(x < 0, 0, np.where(x >= 1, 1, self.cumulative_normed_ps[bin]))
 
     def ppf(self, q):
-        bin = np.argmin(np.abs(self.cumulative_normed_ps - q))
-        return self.true_grid[bin]
+        """
+        Return the x at which the cumulative density reaches q,
+        interpolating linearly between the edges of the bin that
+        contains it (the exact inverse of the histogram cdf).
+
+        :param q: The quantile at which to invert the cdf
+        """
+        idx = np.clip(
+            np.searchsorted(self.cumulative_normed_ps, q),
+            1,
+            self.cumulative_normed_ps.size - 1,
+        )
+        lo_p = self.cumulative_normed_ps[idx - 1]
+        hi_p = self.cumulative_normed_ps[idx]
+        frac = (q - lo_p) / np.maximum(hi_p - lo_p, 0.0000001)
+        lo_x = self.true_grid[idx - 1]
+        return lo_x + frac * (self.true_grid[idx] - lo_x)
+
+    def _containing_bin(self, x):
+        """
+        Index of the bin whose grid edges bracket normalized x, clipped
+        to the outermost bins (out-of-range queries are masked by the
+        callers).
+        """
+        return np.clip(
+            np.searchsorted(constants.grid, x) - 1, 0, self.normed_densities.size - 1
+        )
 
     def modes(self, *args, **kwargs):
         """
@@ -168,14 +192,21 @@ class PointDensity(Distribution, Optimizable):
             densities=density_numeric[1],
             scale=scale_classes[0].structure((scale_classes, scale_numeric)),
             normalized=True,
-            traceable=True,
             cumulative_normed_ps=density_numeric[2],
+            true_xs=density_numeric[3],
+            bin_probs=density_numeric[4],
         )
 
     def destructure(self):
         scale_classes, scale_numeric = self.scale.destructure()
         class_params = (self.__class__, scale_classes)
-        self_numeric = self.normed_xs, self.normed_densities, self.cumulative_normed_ps
+        self_numeric = (
+            self.normed_xs,
+            self.normed_densities,
+            self.cumulative_normed_ps,
+            self.true_xs,
+            self.bin_probs,
+        )
         numeric_params = (self_numeric, scale_numeric)
         return (class_params, numeric_params)
 
@@ -183,9 +214,11 @@ class PointDensity(Distribution, Optimizable):
 
     @classmethod
     def from_pairs(cls, pairs, scale: Scale, normalized=False, interpolate=True):
-        sorted_pairs = sorted([(v["x"], v["density"]) for v in pairs])
-        xs = np.array([x for (x, density) in sorted_pairs])
-        densities = np.array([density for (x, density) in sorted_pairs])
+        unsorted_xs = onp.array([float(v["x"]) for v in pairs])
+        unsorted_densities = onp.array([float(v["density"]) for v in pairs])
+        order = onp.argsort(unsorted_xs)
+        xs = np.array(unsorted_xs[order])
+        densities = np.array(unsorted_densities[order])
 
         if not normalized:
             xs = scale.normalize_points(xs)
@@ -229,16 +262,17 @@ class PointDensity(Distribution, Optimizable):
 
         densities = nn.softmax(opt_params) * opt_params.size
 
-        return cls(
-            xs=xs, densities=densities, scale=scale, normalized=True, traceable=True
-        )
+        return cls(xs=xs, densities=densities, scale=scale, normalized=True)
 
     # Optimize Create Helpers
 
     @staticmethod
     def initialize_optimizable_params(fixed_params):
+        # Zeros are the neutral input to the softmax in from_params and
+        # yield the uniform density; softmax is shift-invariant so there
+        # is no need to invert it for an initial guess.
         num_points = fixed_params["xs"].size
-        return onp.full(num_points, 1.0)
+        return onp.zeros(num_points)
 
     @classmethod
     def normalize_fixed_params(self, fixed_params, scale):
@@ -258,16 +292,16 @@ class PointDensity(Distribution, Optimizable):
             density = (densities[0] - densities[1]) / xdiff_ratio + densities[0]
             clamped_density = onp.maximum(density, 0)
 
-            xs = onp.append(onp.array([scale.low]), xs)
-            densities = onp.append(np.array([clamped_density]), densities)
+            xs = onp.concatenate(([scale.low], xs))
+            densities = onp.concatenate(([clamped_density], densities))
 
         if xs[-1] != scale.high:
             xdiff_ratio = (xs[-1] - xs[-2]) / (scale.high - xs[-1])
             density = (densities[-1] - densities[-2]) / xdiff_ratio + densities[-1]
             clamped_density = onp.maximum(density, 0)
 
-            xs = onp.append(xs, onp.array([scale.high]))
-            densities = onp.append(densities, np.array([clamped_density]))
+            xs = onp.concatenate((xs, [scale.high]))
+            densities = onp.concatenate((densities, [clamped_density]))
 
         return xs, densities
 
@@ -305,20 +339,28 @@ class PointDensity(Distribution, Optimizable):
 
     def to_pairs(self, *args, **kwargs):
         xs, densities = self.to_arrays(*args, **kwargs)
+        # One host transfer per array instead of one per element
+        xs_list = onp.asarray(xs).tolist()
+        densities_list = onp.asarray(densities).tolist()
         pairs = [
-            {"x": float(x), "density": float(density)}
-            for x, density in zip(xs, densities)
+            {"x": x, "density": density} for x, density in zip(xs_list, densities_list)
         ]
         return pairs
 
     # Condition Methods
 
     def entropy(self):
-        return -np.dot(self.bin_probs, safe_log(self.bin_probs))
+        # log(bin_probs) = log(densities) + log(bin_sizes); the first
+        # term is already cached and the second is a constant
+        return -np.dot(
+            self.bin_probs, self.normed_log_densities + constants.log_bin_sizes
+        )
 
     def cross_entropy(self, q_dist):
         # We assume that the distributions are on the same scale!
-        return -np.dot(self.bin_probs, safe_log(q_dist.bin_probs))
+        return -np.dot(
+            self.bin_probs, q_dist.normed_log_densities + constants.log_bin_sizes
+        )
 
     def mean(self):
         return np.dot(self.true_xs, self.bin_probs)
@@ -326,3 +368,38 @@ class PointDensity(Distribution, Optimizable):
     def variance(self):
         mean = self.mean()
         return np.dot(self.bin_probs, np.square(self.true_xs - mean))
+
+
+# Register PointDensity as a jax pytree so instances can be passed
+# directly into jit/grad/vmap without going through
+# destructure/structure. The arrays are the traced children; the scale
+# is hashable and rides along as aux data.
+
+
+def _flatten_point_density(dist):
+    children = (
+        dist.normed_xs,
+        dist.normed_densities,
+        dist.cumulative_normed_ps,
+        dist.true_xs,
+        dist.bin_probs,
+    )
+    return children, dist.scale
+
+
+def _unflatten_point_density(scale, children):
+    normed_xs, normed_densities, cumulative_normed_ps, true_xs, bin_probs = children
+    return PointDensity(
+        normed_xs,
+        normed_densities,
+        scale,
+        normalized=True,
+        cumulative_normed_ps=cumulative_normed_ps,
+        true_xs=true_xs,
+        bin_probs=bin_probs,
+    )
+
+
+tree_util.register_pytree_node(
+    PointDensity, _flatten_point_density, _unflatten_point_density
+)
@@ -279,20 +279,24 @@ class ContinuousQuestion(MetaculusQuestion):
         :return: One sample on the normalized scale
         """
 
-        # FIXME: Samples below/above range are pretty arbitrary
-        sample_below_range = -dist.halfnormal(0.1)
-        sample_above_range = 1 + dist.halfnormal(0.1)
-        sample_in_range = ppl.sample(self.community_dist_in_range()) / float(
-            len(self.prediction_histogram)
-        )
-        p_below = self.latest_community_percentiles["low"]
-        p_above = 1 - self.latest_community_percentiles["high"]
+        percentiles = self.latest_community_percentiles
+        p_below = percentiles["low"]
+        p_above = 1 - percentiles["high"]
         p_in_range = 1 - p_below - p_above
+
+        # Pick the region first and only draw the sample that region
+        # needs, instead of drawing all three candidates every call
+        region = dist.random_choice(
+            ["below", "in_range", "above"], ps=[p_below, p_in_range, p_above]
+        )
+        # FIXME: Samples below/above range are pretty arbitrary
+        if region == "below":
+            return float(-dist.halfnormal(0.1))
+        elif region == "above":
+            return float(1 + dist.halfnormal(0.1))
         return float(
-            dist.random_choice(
-                [sample_below_range, sample_in_range, sample_above_range],
-                ps=[p_below, p_in_range, p_above],
-            )
+            ppl.sample(self.community_dist_in_range())
+            / float(len(self.prediction_histogram))
         )
 
     def sample_community(self) -> float:
@@ -1,6 +1,6 @@
 from functools import partial
 
-from jax import grad, jit, vmap
+from jax import grad, jit, tree_util, value_and_grad, vmap
 import jax.numpy as np
 import jax.scipy as scipy
 
@@ -12,9 +12,6 @@ import jax.scipy as scipy
 def jitted_condition_loss(
     dist_class, dist_fixed_params, dist_opt_params, cond_classes, cond_params
 ):
-    print(
-        f"Tracing {dist_class.__name__} ({dist_fixed_params}) loss for {[c[0].__name__ for c in cond_classes]} ({str(cond_params)[:60]})"
-    )
     dist = dist_class.from_params(dist_fixed_params, dist_opt_params, traceable=True)
     total_loss = 0.0
     for (cond_class, cond_param) in zip(cond_classes, cond_params):
@@ -32,26 +29,87 @@ jitted_condition_loss_grad = jit(
 # for histogram dist + arbitrary losses)
 
 
+def group_conditions(cond_classes, cond_params):
+    """
+    Group conditions of the same class (and param structure) together,
+    stacking their numeric params along a new leading axis so that a
+    whole group can be evaluated in one vmapped call.
+    """
+    groups: dict = {}
+    for (cond_class, cond_param) in zip(cond_classes, cond_params):
+        leaves, treedef = tree_util.tree_flatten(cond_param)
+        key = (cond_class, str(treedef), tuple(np.shape(leaf) for leaf in leaves))
+        groups.setdefault(key, []).append(cond_param)
+    for ((cond_class, _, _), params) in groups.items():
+        stacked = tree_util.tree_multimap(lambda *leaves: np.stack(leaves), *params)
+        yield cond_class, stacked
+
+
 def condition_loss(
     dist_class, dist_fixed_params, dist_opt_params, cond_classes, cond_params
 ):
-    total_loss = 0.0
-    for (cond_class, cond_param) in zip(cond_classes, cond_params):
-        total_loss += single_condition_loss(
-            dist_class, dist_fixed_params, dist_opt_params, cond_class, cond_param
-        )
-    return total_loss
+    groups = list(group_conditions(cond_classes, cond_params))
+    if not groups:
+        return 0.0
+    group_classes, group_params = zip(*groups)
+    return grouped_condition_loss(
+        dist_class, dist_fixed_params, dist_opt_params, group_classes, group_params
+    )
 
 
 def condition_loss_grad(
     dist_class, dist_fixed_params, dist_opt_params, cond_classes, cond_params
 ):
-    total_grad = 0.0
-    for (cond_class, cond_param) in zip(cond_classes, cond_params):
-        total_grad += single_condition_loss_grad(
-            dist_class, dist_fixed_params, dist_opt_params, cond_class, cond_param
-        )
-    return total_grad
+    groups = list(group_conditions(cond_classes, cond_params))
+    if not groups:
+        return np.zeros_like(dist_opt_params)
+    group_classes, group_params = zip(*groups)
+    return grouped_condition_loss_grad(
+        dist_class, dist_fixed_params, dist_opt_params, group_classes, group_params
+    )
+
+
+def condition_loss_and_grad(
+    dist_class, dist_fixed_params, dist_opt_params, cond_classes, cond_params
+):
+    groups = list(group_conditions(cond_classes, cond_params))
+    if not groups:
+        return 0.0, np.zeros_like(dist_opt_params)
+    group_classes, group_params = zip(*groups)
+    return grouped_condition_loss_and_grad(
+        dist_class, dist_fixed_params, dist_opt_params, group_classes, group_params
+    )
+
+
+def batched_group_loss(dist, cond_class, stacked_cond_params):
+    def a_condition_loss(cond_param):
+        condition = cond_class[0].structure((cond_class, cond_param))
+        return condition.loss(dist)
+
+    return np.sum(vmap(a_condition_loss)(stacked_cond_params))
+
+
+@partial(jit, static_argnums=(0, 3))
+def grouped_condition_loss(
+    dist_class, dist_fixed_params, dist_opt_params, group_classes, group_params
+):
+    # The distribution is built once here, outside the per-group vmaps,
+    # so the whole step is a single dispatch no matter how many
+    # condition groups there are
+    dist = dist_class.from_params(dist_fixed_params, dist_opt_params, traceable=True)
+    total_loss = 0.0
+    for (cond_class, stacked_params) in zip(group_classes, group_params):
+        total_loss += batched_group_loss(dist, cond_class, stacked_params)
+    return total_loss * 100
+
+
+grouped_condition_loss_grad = jit(
+    grad(grouped_condition_loss, argnums=2), static_argnums=(0, 3)
+)
+
+grouped_condition_loss_and_grad = jit(
+    value_and_grad(grouped_condition_loss, argnums=2), static_argnums=(0, 3)
+)
 
 
 @partial(jit, static_argnums=(0, 3))
@@ -61,15 +119,7 @@ def single_condition_loss(
 
     dist = dist_class.from_params(dist_fixed_params, dist_opt_params, traceable=True)
     condition = cond_class[0].structure((cond_class, cond_param))
-    loss = condition.loss(dist) * 100
-    print(
-        f"Tracing {cond_class[0].__name__} loss for {dist_class.__name__} distribution:\n"
-        f"- Fixed: {dist_fixed_params}\n"
-        f"- Optim: {dist_opt_params}\n"
-        f"- Cond: {cond_param}\n"
-        f"- Loss: {loss}\n\n"
-    )
-    return loss
+    return condition.loss(dist) * 100
 
 
 single_condition_loss_grad = jit(
@@ -94,14 +144,14 @@ def describe_fit(dist_classes, dist_params, cond_class, cond_params):
 @partial(jit, static_argnums=0)
 def dist_logloss(dist_class, fixed_params, opt_params, data):
     dist = dist_class.from_params(fixed_params, opt_params, traceable=True)
-    if data.size == 1:
-        return -dist.logpdf(data)
-    scores = vmap(dist.logpdf)(data)
-    return -np.sum(scores)
+    # logpdf is natively batched, so score the whole sample set at once
+    return -np.sum(dist.logpdf(data))
 
 
 dist_grad_logloss = jit(grad(dist_logloss, argnums=2), static_argnums=0)
 
+dist_logloss_and_grad = jit(value_and_grad(dist_logloss, argnums=2), static_argnums=0)
+
 
 # Logistic mixture
 
@@ -109,30 +159,27 @@ dist_grad_logloss = jit(grad(dist_logloss, argnums=2), static_argnums=0)
 @jit
 def logistic_logpdf(x, loc, scale):
     # x, loc, scale are assumed to be normalized
-    # https://docs.scipy.org/doc/scipy/reference/generated/scipy.stats.logistic.html
-    y = (x - loc) / scale
-    return scipy.stats.logistic.logpdf(y) - np.log(scale)
+    # logpdf(y) = -y - 2*log(1 + exp(-y)), written in terms of |y| so the
+    # exp never overflows
+    y = np.abs((x - loc) / scale)
+    return -y - 2 * np.log1p(np.exp(-y)) - np.log(scale)
 
 
 @jit
 def logistic_mixture_logpdf(params, data):
-    # params are assumed to be normalized
-    if data.size == 1:
-        return logistic_mixture_logpdf1(params, data)
-    scores = vmap(partial(logistic_mixture_logpdf1, params))(data)
-    return np.sum(scores)
-
-
-@jit
-def logistic_mixture_logpdf1(params, datum):
     # params are assumed to be normalized
     structured_params = params.reshape((-1, 3))
-    component_scores = []
-    for (loc, scale, component_prob) in structured_params:
-        component_scores.append(
-            logistic_logpdf(datum, loc, scale) + np.log(component_prob)
-        )
-    return scipy.special.logsumexp(np.array(component_scores))
+    locs = structured_params[:, 0]
+    scales = structured_params[:, 1]
+    # log(scales) and log(probs) depend only on the K components, so
+    # take them once here instead of once per (datum, component) pair
+    log_scales = np.log(scales)
+    log_probs = np.log(structured_params[:, 2])
+    # broadcast the (N, 1) data against the (K,) component params to
+    # score all data points under all components at once
+    y = np.abs((np.reshape(data, (-1, 1)) - locs) / scales)
+    scores = -y - 2 * np.log1p(np.exp(-y)) - log_scales + log_probs
+    return np.sum(scipy.special.logsumexp(scores, axis=1))
 
 
 logistic_mixture_grad_logpdf = jit(grad(logistic_mixture_logpdf, argnums=0))
@@ -2,6 +2,7 @@ import functools
 import weakref
 
 import jax.numpy as np
+import numpy as onp
 import scipy as oscipy
 
 
@@ -32,16 +33,7 @@ def memoized_method(*lru_args, **lru_kwargs):
 
 
 def minimize_random(fun, init, tries=100):
-    best_x = None
-    best_loss = float("+inf")
-    while tries > 0:
-        x = init()
-        loss = fun(x)
-        if best_x is None or loss < best_loss:
-            best_x = x
-            best_loss = loss
-        tries -= 1
-    return best_x
+    return min((init() for _ in range(tries)), key=fun)
 
 
 def minimize(fun, *args, init=None, init_tries=1, opt_tries=1, verbose=False, **kwargs):
@@ -51,6 +43,17 @@ def minimize(fun, *args, init=None, init_tries=1, opt_tries=1, verbose=False, **
     if "x0" in kwargs:
         raise ValueError("Provide initialization function (init), not x0")
 
+    # L-BFGS-B converges in fewer function/gradient evaluations than
+    # scipy's default BFGS on our high-dimensional fits and doesn't
+    # build a dense inverse Hessian
+    kwargs.setdefault("method", "L-BFGS-B")
+
+    jac = kwargs.get("jac")
+    if callable(jac):
+        # scipy's L-BFGS-B Fortran core requires float64 gradients;
+        # jax-computed gradients come back as float32 device arrays
+        kwargs["jac"] = lambda x: onp.asarray(jac(x), dtype=onp.float64)
+
     best_results = None
     best_loss = float("+inf")
     while opt_tries > 0: